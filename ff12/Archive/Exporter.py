@@ -0,0 +1,80 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .Model import TreeNode
+from .Reader import ArchiveReader
+
+
+class ArchiveExporter(QThread):
+    """Background thread for exporting files from archive."""
+    progress = pyqtSignal(int, str)
+    completed = pyqtSignal(int, list)
+
+    # Minimum time between progress updates in seconds.
+    _PROGRESS_INTERVAL = 0.05
+    # Reads from the archive are serialized anyway, more workers would only add memory and contention.
+    _MAX_WORKERS = 4
+
+    def __init__(self, reader: ArchiveReader, files: list[TreeNode], export_path: Path):
+        super().__init__()
+        self._reader = reader
+        self._files = [(node.name, node.path()) for node in files]
+        self._export_path = export_path
+        self._canceled = False
+
+    @property
+    def export_path(self) -> Path:
+        return self._export_path
+
+    @property
+    def total_count(self) -> int:
+        return len(self._files)
+
+    def cancel(self):
+        """Stop exporting, files that are already being unpacked still finish."""
+        self._canceled = True
+        self.requestInterruption()
+
+    def run(self):
+        """Export files in background thread, unpacking them in parallel."""
+        exported_count = 0
+        failed_files = []
+        last_progress = 0.0
+
+        with self._reader as reader, ThreadPoolExecutor(max_workers = min(self._MAX_WORKERS, os.cpu_count() or 1)) as executor:
+            futures = {
+                executor.submit(self._export_file, reader, relative_path, self._export_path): (name, relative_path)
+                for name, relative_path in self._files
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                if self._canceled or self.isInterruptionRequested():
+                    for pending in futures:
+                        pending.cancel()
+                    break
+
+                name, relative_path = futures[future]
+                now = time.monotonic()
+                if now - last_progress >= self._PROGRESS_INTERVAL:
+                    last_progress = now
+                    self.progress.emit(i, name)
+
+                try:
+                    future.result()
+                    exported_count += 1
+                except Exception as e:
+                    failed_files.append(f"{relative_path} ({str(e)})")
+
+        self.completed.emit(exported_count, failed_files)
+
+    @staticmethod
+    def _export_file(reader: ArchiveReader, relative_path: str, export_path: Path):
+        """Unpack a single file into the export directory. Runs in a worker thread."""
+        output_file = export_path / Path(relative_path)
+        output_file.parent.mkdir(parents = True, exist_ok = True)
+
+        reader.unpack_file(relative_path, output_file)
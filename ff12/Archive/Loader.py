@@ -1,23 +1,28 @@
 from pathlib import Path
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 
 from .Reader import ArchiveReader
 
 
-class ArchiveLoader(QThread):
-    """Background thread for loading archive."""
-    finished = pyqtSignal(object)
-    error = pyqtSignal(str)
+class ArchiveLoader(QObject):
+    """Worker for loading archives, meant to live on a background thread."""
+    finished = pyqtSignal(object, int)
+    error = pyqtSignal(str, int)
 
-    def __init__(self, archive_path: Path):
+    def __init__(self):
         super().__init__()
-        self._archive_path = archive_path
+        # Latest requested generation, loads requested before it are skipped.
+        self.generation = 0
 
-    def run(self):
+    @pyqtSlot(object, int)
+    def load(self, archive_path: Path, generation: int):
         """Load archive in background thread."""
+        if generation != self.generation:
+            return
+
         try:
-            reader = ArchiveReader(self._archive_path)
-            self.finished.emit(reader)
+            reader = ArchiveReader(archive_path)
+            self.finished.emit(reader, generation)
         except Exception as e:
-            self.error.emit(str(e))
+            self.error.emit(str(e), generation)
@@ -1,9 +1,12 @@
+import sys
 from enum import IntEnum, auto
+from functools import lru_cache
 
 from PyQt6.QtCore import QAbstractItemModel, QFileInfo, QModelIndex, Qt
+from PyQt6.QtGui import QIcon
 from PyQt6.QtWidgets import QFileIconProvider
 
-from .Reader import ArchiveReader
+from .Reader import ArchiveEntry, ArchiveReader
 
 
 class TreeNode:
@@ -14,8 +17,16 @@ class TreeNode:
         self.size = size
         self.children = []
         self.entry = entry
+        self._lower_name = name.lower()
+        self._suffix = name.rpartition('.')[2].lower() if not is_dir and '.' in name else ""
+        self._row = 0
+        self._sorted_key = None
+        # Entries below a directory, relative to it, whose nodes were not created yet.
+        # None once the children were fetched.
+        self._pending_entries: list[tuple[str, ArchiveEntry]] | None = [] if is_dir else None
 
         if parent:
+            self._row = len(parent.children)
             parent.children.append(self)
 
     def child_count(self) -> int:
@@ -27,9 +38,40 @@ class TreeNode:
         return None
 
     def row(self) -> int:
-        if self.parent:
-            return self.parent.children.index(self)
-        return 0
+        return self._row
+
+    def has_children(self) -> bool:
+        return bool(self.children or self._pending_entries)
+
+    def can_fetch_more(self) -> bool:
+        return self._pending_entries is not None
+
+    def group_pending_entries(self) -> tuple[dict[str, list[tuple[str, ArchiveEntry]]], list[tuple[str, ArchiveEntry]]]:
+        """Group pending entries into entries of each direct subdirectory and direct file entries."""
+        dir_entries: dict[str, list[tuple[str, ArchiveEntry]]] = {}
+        file_entries: list[tuple[str, ArchiveEntry]] = []
+        for name, entry in self._pending_entries or []:
+            dir_name, separator, rest = name.partition('/')
+            if separator:
+                dir_entries.setdefault(dir_name, []).append((rest, entry))
+            else:
+                file_entries.append((name, entry))
+
+        return dir_entries, file_entries
+
+    def fetch_children(self, dir_entries: dict[str, list[tuple[str, ArchiveEntry]]], file_entries: list[tuple[str, ArchiveEntry]]):
+        """Create child nodes from grouped pending entries. Subdirectories stay unfetched.
+        Pending entries are sorted by path, so children end up sorted by name in ascending order.
+        """
+        for dir_name in sorted(dir_entries):
+            dir_node = TreeNode(sys.intern(dir_name), self, True)
+            dir_node._pending_entries = dir_entries[dir_name]
+
+        for filename, entry in file_entries:
+            TreeNode(filename, self, False, entry.original_size, entry)
+
+        self._pending_entries = None
+        self._sorted_key = (ArchiveColumn.NAME, Qt.SortOrder.AscendingOrder)
 
     def path(self) -> str:
         """Get the full path to this node."""
@@ -38,40 +80,61 @@ class TreeNode:
         return self.name
 
     def sort_children(self, column: int, order: Qt.SortOrder):
-        """Sort children by the specified column and order.
+        """Sort children by the specified column and order, without descending into them.
         Directories always come before files.
         Directories only reorder when column == NAME.
+        Does nothing if already sorted the same way, and only reverses
+        the current order if just the sort order changed.
         """
-        dirs = [i for i in self.children if i.is_dir]
-        if column == ArchiveColumn.NAME:
-            dirs.sort(key=lambda node: node.name.lower(),
-                    reverse=(order == Qt.SortOrder.DescendingOrder))
+        sort_key = (column, order)
+        if self._sorted_key == sort_key or self._pending_entries is not None:
+            return
 
+        dirs = [i for i in self.children if i.is_dir]
         files = [i for i in self.children if not i.is_dir]
-        if column == ArchiveColumn.NAME:
-            files.sort(key=lambda node: node.name.lower(),
-                    reverse=(order == Qt.SortOrder.DescendingOrder))
-        elif column == ArchiveColumn.TYPE:
-            files.sort(key=lambda node: QFileInfo(node.name).suffix().lower(),
-                    reverse=(order == Qt.SortOrder.DescendingOrder))
-        elif column == ArchiveColumn.SIZE:
-            files.sort(key=lambda node: node.size,
-                    reverse=(order == Qt.SortOrder.DescendingOrder))
 
+        if self._sorted_key is not None and self._sorted_key[0] == column:
+            if column == ArchiveColumn.NAME:
+                dirs.reverse()
+            files.reverse()
+        else:
+            if column == ArchiveColumn.NAME:
+                dirs.sort(key=lambda node: node._lower_name,
+                        reverse=(order == Qt.SortOrder.DescendingOrder))
+
+            if column == ArchiveColumn.NAME:
+                files.sort(key=lambda node: node._lower_name,
+                        reverse=(order == Qt.SortOrder.DescendingOrder))
+            elif column == ArchiveColumn.TYPE:
+                files.sort(key=lambda node: node._suffix,
+                        reverse=(order == Qt.SortOrder.DescendingOrder))
+            elif column == ArchiveColumn.SIZE:
+                files.sort(key=lambda node: node.size,
+                        reverse=(order == Qt.SortOrder.DescendingOrder))
+
+        self._sorted_key = sort_key
         self.children = dirs + files
-        for i in dirs:
-            i.sort_children(column, order)
+        for row, child in enumerate(self.children):
+            child._row = row
 
 class ArchiveColumn(IntEnum):
     NAME = 0
     TYPE = auto()
     SIZE = auto()
 
+# Most archives only use a few suffixes, this just keeps odd ones from piling up.
+MAX_CACHED_FILE_ICONS = 512
+
+@lru_cache(maxsize = 1)
+def _icon_provider() -> QFileIconProvider:
+    """Icon provider shared by all archive models, created once the application is running."""
+    return QFileIconProvider()
+
 class ArchiveModel(QAbstractItemModel):
     def __init__(self, parent = None):
         super().__init__(parent)
         self._reader = None
-        self._icon_provider = QFileIconProvider()
+        self._folder_icon = _icon_provider().icon(QFileIconProvider.IconType.Folder)
         self._root_node = TreeNode("", None, True)
         self._sort_column = ArchiveColumn.NAME
         self._sort_order = Qt.SortOrder.AscendingOrder
@@ -84,45 +147,26 @@ class ArchiveModel(QAbstractItemModel):
         self.endResetModel()
 
     def _build_tree(self):
-        """Build the tree structure from archive entries."""
-        dir_nodes: dict[str, TreeNode] = {"": self._root_node}
-        sorted_entries = sorted(self._reader._entries.items(), key = lambda x: x[0])
-
-        for name, entry in sorted_entries:
-            path_parts = name.split('/')
-            current_path = ""
-            current_node = self._root_node
-
-            for i, part in enumerate(path_parts[:-1]):
-                if current_path:
-                    current_path += "/" + part
-                else:
-                    current_path = part
-
-                if current_path not in dir_nodes:
-                    dir_node = TreeNode(part, current_node, True)
-                    dir_nodes[current_path] = dir_node
-                    current_node = dir_node
-                else:
-                    current_node = dir_nodes[current_path]
-
-            filename = path_parts[-1]
-            TreeNode(filename, current_node, False, entry.original_size, entry)
+        """Build the tree structure from archive entries.
+        Only the top level is created, directories are fetched on expansion.
+        """
+        self._root_node = TreeNode("", None, True)
+        self._root_node._pending_entries = self._reader.sorted_entries()
+        self._root_node.fetch_children(*self._root_node.group_pending_entries())
 
     def _sort_tree(self):
-        """Sort the entire tree."""
-        self._root_node.sort_children(self._sort_column, self._sort_order)
+        """Sort the entire tree, skipping directories that are already sorted."""
+        sort_key = (self._sort_column, self._sort_order)
+        stack = [self._root_node]
+        while stack:
+            node = stack.pop()
+            node.sort_children(*sort_key)
+            stack.extend(child for child in node.children if child.is_dir and child._sorted_key != sort_key)
 
     def sort(self, column: int, order: Qt.SortOrder):
         """Implement sorting with proper persistent index handling"""
-        persistent_indexes = self.persistentIndexList()
-
-        old_nodes = []
-        for index in persistent_indexes:
-            if index.isValid():
-                old_nodes.append(index.internalPointer())
-            else:
-                old_nodes.append(None)
+        if self._root_node._sorted_key == (column, order):
+            return
 
         self.layoutAboutToBeChanged.emit([], QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
 
@@ -130,37 +174,63 @@ class ArchiveModel(QAbstractItemModel):
         self._sort_order = order
         self._sort_tree()
 
-        new_indexes = []
-        for node in old_nodes:
-            if node is not None:
-                new_index = self._find_index_for_node(node)
-                new_indexes.append(new_index)
-            else:
-                new_indexes.append(QModelIndex())
+        # Nodes keep track of their row, so each persistent index maps to its new position directly.
+        old_indexes = [index for index in self.persistentIndexList() if index.isValid()]
+        if old_indexes:
+            new_indexes = []
+            for index in old_indexes:
+                node = index.internalPointer()
+                new_indexes.append(self.createIndex(node.row(), index.column(), node))
 
-        for old_index, new_index in zip(persistent_indexes, new_indexes):
-            self.changePersistentIndex(old_index, new_index)
+            self.changePersistentIndexList(old_indexes, new_indexes)
 
         self.layoutChanged.emit([], QAbstractItemModel.LayoutChangeHint.VerticalSortHint)
 
-    def _find_index_for_node(self, target_node: TreeNode) -> QModelIndex:
-        """Find the QModelIndex for a specific TreeNode after sorting"""
-        if target_node == self._root_node:
-            return QModelIndex()
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            parent_node = self._root_node
+        else:
+            parent_node = parent.internalPointer()
+
+        return parent_node.is_dir and parent_node.has_children()
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        if not parent.isValid():
+            parent_node = self._root_node
+        else:
+            parent_node = parent.internalPointer()
+
+        return parent_node.can_fetch_more()
 
-        path = []
-        current = target_node
-        while current and current != self._root_node:
-            path.append(current)
-            current = current.parent
+    def fetchMore(self, parent: QModelIndex):
+        if not parent.isValid():
+            parent_node = self._root_node
+        else:
+            parent_node = parent.internalPointer()
+
+        if not parent_node.can_fetch_more():
+            return
+
+        dir_entries, file_entries = parent_node.group_pending_entries()
+        count = len(dir_entries) + len(file_entries)
+        if count:
+            self.beginInsertRows(parent, 0, count - 1)
+
+        parent_node.fetch_children(dir_entries, file_entries)
+        parent_node.sort_children(self._sort_column, self._sort_order)
 
-        current_index = QModelIndex()
-        for node in reversed(path):
-            parent_node = node.parent if node.parent else self._root_node
-            row = parent_node.children.index(node)
-            current_index = self.index(row, 0, current_index)
+        if count:
+            self.endInsertRows()
 
-        return current_index
+    def fetch_all(self, index: QModelIndex):
+        """Fetch all nodes below the given index."""
+        stack = [index]
+        while stack:
+            index = stack.pop()
+            self.fetchMore(index)
+
+            node = self.get_node(index) or self._root_node
+            stack.extend(self.index(child.row(), 0, index) for child in node.children if child.is_dir)
 
     def rowCount(self, parent: QModelIndex) -> int:
         if not parent.isValid():
@@ -214,8 +284,7 @@ class ArchiveModel(QAbstractItemModel):
                 if node.is_dir:
                     return "Folder"
                 else:
-                    file_info = QFileInfo(node.name)
-                    return file_info.suffix()
+                    return node._suffix
             elif column == ArchiveColumn.SIZE:
                 if node.is_dir:
                     return ""
@@ -224,13 +293,19 @@ class ArchiveModel(QAbstractItemModel):
 
         elif role == Qt.ItemDataRole.DecorationRole and column == ArchiveColumn.NAME:
             if node.is_dir:
-                return self._icon_provider.icon(QFileIconProvider.IconType.Folder)
+                return self._folder_icon
             else:
-                file_info = QFileInfo(node.name)
-                return self._icon_provider.icon(file_info)
+                return self._file_icon(node._suffix)
 
         return None
 
+    @staticmethod
+    @lru_cache(maxsize = MAX_CACHED_FILE_ICONS)
+    def _file_icon(suffix: str) -> QIcon:
+        """Get the icon for files with the given suffix, shared between archives."""
+        # Archive entries don't exist on disk, so the provider only goes by the suffix of the name anyway.
+        return _icon_provider().icon(QFileInfo(f"file.{suffix}" if suffix else "file"))
+
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> str | None:
         if orientation != Qt.Orientation.Horizontal or role != Qt.ItemDataRole.DisplayRole:
             return None
@@ -251,21 +326,22 @@ class ArchiveModel(QAbstractItemModel):
             return index.internalPointer()
         return None
 
+    _SIZE_UNITS = ("B", "KB", "MB", "GB")
+
     @staticmethod
+    @lru_cache(maxsize = 4096)
     def _format_file_size(size: int) -> str:
         """Format file size (B, KB, MB, GB) with proper fallback."""
         if size < 1024:
             return f"{size} B"
 
-        size_f = float(size)
-        for unit in ['KB', 'MB', 'GB']:
-            size_f /= 1024.0
-            if size_f < 1024.0:
-                if size_f < 10:
-                    return f"{size_f:.2f} {unit}"
-                elif size_f < 100:
-                    return f"{size_f:.1f} {unit}"
-                else:
-                    return f"{size_f:.0f} {unit}"
+        unit = min((size.bit_length() - 1) // 10, len(ArchiveModel._SIZE_UNITS) - 1)
+        size_f = size / (1 << (unit * 10))
+        unit_name = ArchiveModel._SIZE_UNITS[unit]
 
-        return f"{size_f:.2f} GB"
+        if size_f < 10 or size_f >= 1024:
+            return f"{size_f:.2f} {unit_name}"
+        elif size_f < 100:
+            return f"{size_f:.1f} {unit_name}"
+        else:
+            return f"{size_f:.0f} {unit_name}"
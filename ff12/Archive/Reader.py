@@ -1,25 +1,51 @@
 import io
 import struct
+import sys
+import threading
 import zlib
+from array import array
+from functools import cached_property
 from pathlib import Path
-from typing import BinaryIO, Dict, List
+from typing import BinaryIO, Dict, List, Sequence
 
 from PyQt6.QtCore import qWarning
 
 
 class ArchiveEntry:
-    def __init__(self, original_size: int, data_offset: int, block_sizes: List[int]):
+    def __init__(self, original_size: int, data_offset: int, global_block_sizes: Sequence[int], block_start: int, block_count: int):
         self.original_size = original_size
         self.data_offset = data_offset
-        self.block_sizes = block_sizes
+        self._global_block_sizes = global_block_sizes
+        self._block_start = block_start
+        self._block_count = block_count
+
+    @cached_property
+    def block_sizes(self) -> Sequence[int]:
+        """Block sizes of this file, sliced from the archive-wide table on first use."""
+        return self._global_block_sizes[self._block_start:self._block_start + self._block_count]
+
+    @cached_property
+    def is_uncompressed(self) -> bool:
+        """True if none of the file blocks are compressed."""
+        if not self.block_sizes:
+            return True
+
+        remaining_size = self.original_size % ArchiveReader._MAX_BLOCK_SIZE
+        last_block_size = self.block_sizes[-1]
+        return (all(block_size == 0 for block_size in self.block_sizes[:-1])
+                and (last_block_size == 0 or last_block_size == remaining_size))
 
 class ArchiveReader:
     _MAX_BLOCK_SIZE = 64 * 1024
+    # Files up to this size are read into memory whole before writing them out.
+    _MAX_BUFFERED_SIZE = 4 * 1024 * 1024
 
     def __init__(self, path: Path):
         self._filename = path
         self._entries: Dict[str, ArchiveEntry] = {}
+        self._entries_sorted = True
         self._file_handle: BinaryIO | None = None
+        self._read_lock = threading.Lock()
 
         self._load_metadata()
 
@@ -71,36 +97,41 @@ class ArchiveReader:
 
                 file_metadata = self._read_file_metadata(file, file_count)
                 file_path_data = self._read_file_path_data(file)
-                block_count = self._get_block_count(file_metadata)
-                global_block_sizes = self._read_block_sizes(file, block_count)
-
-                for block_sizes_start_index, original_size, data_offset, filepath_offset in file_metadata:
-                    name = self._read_null_string_lower(file_path_data, filepath_offset)
-
-                    blocks = original_size // self._MAX_BLOCK_SIZE
-                    if original_size % self._MAX_BLOCK_SIZE != 0:
-                        blocks += 1
-
-                    file_block_sizes = global_block_sizes[block_sizes_start_index:block_sizes_start_index + blocks]
-                    self._entries[name] = ArchiveEntry(original_size, data_offset, file_block_sizes)
+                file_block_counts = self._get_block_counts(file_metadata)
+                global_block_sizes = self._read_block_sizes(file, sum(file_block_counts))
+                file_paths = self._split_null_strings_lower(file_path_data)
+                previous_name = ""
+
+                for (block_sizes_start_index, original_size, data_offset, filepath_offset), blocks in zip(file_metadata, file_block_counts):
+                    name = file_paths.get(filepath_offset)
+                    if name is None:
+                        name = self._read_null_string_lower(file_path_data, filepath_offset)
+                    if name < previous_name:
+                        self._entries_sorted = False
+                    previous_name = name
+                    self._entries[name] = ArchiveEntry(original_size, data_offset, global_block_sizes, block_sizes_start_index, blocks)
 
             except Exception as e:
                 qWarning(f"Failed to load archive metadata: {e}")
 
+    def sorted_entries(self) -> List[tuple[str, ArchiveEntry]]:
+        """Get entries sorted by path. Sorting is skipped if the archive already stores them in order."""
+        if self._entries_sorted:
+            return list(self._entries.items())
+
+        return sorted(self._entries.items(), key = lambda x: x[0])
+
     def _read_file_metadata(self, file: BinaryIO, count: int) -> List[tuple]:
         """Read metadata for file entries"""
         file_struct = struct.Struct("<IIQQQ")
-        file_metadata = []
-
-        for _ in range(count):
-            data = file.read(file_struct.size)
-            if len(data) < file_struct.size:
-                raise EOFError("Unexpected EOF reading file metadata")
-
-            block_sizes_start_index, _, original_size, data_offset, filepath_offset = file_struct.unpack(data)
-            file_metadata.append((block_sizes_start_index, original_size, data_offset, filepath_offset))
+        data = file.read(file_struct.size * count)
+        if len(data) < file_struct.size * count:
+            raise EOFError("Unexpected EOF reading file metadata")
 
-        return file_metadata
+        return [
+            (block_sizes_start_index, original_size, data_offset, filepath_offset)
+            for block_sizes_start_index, _, original_size, data_offset, filepath_offset in file_struct.iter_unpack(data)
+        ]
 
     def _read_file_path_data(self, file: BinaryIO) -> bytes:
         """Read data for file paths"""
@@ -115,26 +146,34 @@ class ArchiveReader:
 
         return path_data
 
-    def _get_block_count(self, file_metadata: List[tuple]) -> int:
-        """Calculate total number of blocks across all files"""
-        count = 0
-        for _, original_size, _, _ in file_metadata:
-            blocks = original_size // self._MAX_BLOCK_SIZE
-            if original_size % self._MAX_BLOCK_SIZE != 0:
-                blocks += 1
-            count += blocks
-        return count
-
-    def _read_block_sizes(self, file: BinaryIO, count: int) -> List[int]:
+    def _get_block_counts(self, file_metadata: List[tuple]) -> List[int]:
+        """Calculate number of blocks for each file"""
+        max_block_size = self._MAX_BLOCK_SIZE
+        return [-(-original_size // max_block_size) for _, original_size, _, _ in file_metadata]
+
+    def _read_block_sizes(self, file: BinaryIO, count: int) -> array:
         """Read block sizes for all files"""
         data = file.read(count * 2)
         if len(data) < count * 2:
             raise ValueError("Unexpected EOF reading block sizes")
 
-        return list(struct.unpack(f"<{count}H", data))
+        block_sizes = array("H", data)
+        if sys.byteorder != "little":
+            block_sizes.byteswap()
+
+        return block_sizes
+
+    def _read_into(self, offset: int, buffer: memoryview) -> int:
+        """Read data at an absolute offset into a buffer. Safe to call from multiple threads."""
+        with self._read_lock:
+            self._file_handle.seek(offset, io.SEEK_SET)
+            return self._file_handle.readinto(buffer)
 
     def unpack_file(self, file_path: str, out_path: str):
-        """Unpack a file from the archive"""
+        """
+        Unpack a file from the archive.
+        Safe to call from multiple threads, decompression runs without holding the GIL.
+        """
         if self._file_handle is None:
             raise ValueError("Archive file handle is not open")
 
@@ -142,28 +181,92 @@ class ArchiveReader:
         if entry is None:
             raise FileNotFoundError(f"File '{file_path}' not found in archive entries")
 
-        self._file_handle.seek(entry.data_offset, io.SEEK_SET)
-        block_count = 0
+        if entry.original_size <= self._MAX_BUFFERED_SIZE:
+            data = self._read_entry(entry)
+            with open(out_path, "wb") as out_file:
+                out_file.write(data)
+            return
+
+        # Large files are written block by block, so several exports at once don't hold whole files in memory.
+        try:
+            with open(out_path, "wb") as out_file:
+                self._stream_entry(entry, out_file)
+        except Exception:
+            Path(out_path).unlink(missing_ok = True)
+            raise
+
+    def _is_stored_block(self, entry: ArchiveEntry, block_index: int, block_size: int) -> bool:
+        """True if the block is stored as is instead of compressed."""
+        return (block_size == self._MAX_BLOCK_SIZE
+                or (block_index == len(entry.block_sizes) - 1
+                    and block_size == entry.original_size % self._MAX_BLOCK_SIZE))
+
+    def _read_entry(self, entry: ArchiveEntry) -> bytearray:
+        """Read and decompress a whole file into memory."""
+        data = bytearray(entry.original_size)
+        data_view = memoryview(data)
+
+        if entry.is_uncompressed:
+            # Whole file is stored as is, so read it in one go.
+            if self._read_into(entry.data_offset, data_view) < entry.original_size:
+                raise EOFError("Unexpected EOF reading data block")
+            return data
+
+        scratch_view = memoryview(bytearray(self._MAX_BLOCK_SIZE))
+        block_offset = entry.data_offset
+        buffer_pos = 0
+
+        for block_index, block_size in enumerate(entry.block_sizes):
+            if block_size == 0:
+                block_size = self._MAX_BLOCK_SIZE
+
+            if self._is_stored_block(entry, block_index, block_size):
+                read_size = self._read_into(block_offset, data_view[buffer_pos:buffer_pos + block_size])
+                if read_size < block_size:
+                    raise EOFError("Unexpected EOF reading data block")
+                buffer_pos += block_size
+            else:
+                read_size = self._read_into(block_offset, scratch_view[:block_size])
+                if read_size < block_size:
+                    raise EOFError("Unexpected EOF reading data block")
+
+                decompressed_data = zlib.decompress(scratch_view[:block_size], bufsize = self._MAX_BLOCK_SIZE)
+                data_view[buffer_pos:buffer_pos + len(decompressed_data)] = decompressed_data
+                buffer_pos += len(decompressed_data)
+
+            block_offset += block_size
+
+        return data
 
-        with open(out_path, "wb") as out_file:
-            for block_size in entry.block_sizes:
-                if block_size == 0:
-                    block_size = self._MAX_BLOCK_SIZE
+    def _stream_entry(self, entry: ArchiveEntry, out_file: BinaryIO):
+        """Read and decompress a file one block at a time, writing each block as soon as it's ready."""
+        scratch_view = memoryview(bytearray(self._MAX_BLOCK_SIZE))
+        block_offset = entry.data_offset
 
-                block_data = self._file_handle.read(block_size)
-                if len(block_data) < block_size:
+        if entry.is_uncompressed:
+            remaining_size = entry.original_size
+            while remaining_size > 0:
+                chunk_size = min(remaining_size, self._MAX_BLOCK_SIZE)
+                if self._read_into(block_offset, scratch_view[:chunk_size]) < chunk_size:
                     raise EOFError("Unexpected EOF reading data block")
+                out_file.write(scratch_view[:chunk_size])
+                block_offset += chunk_size
+                remaining_size -= chunk_size
+            return
 
-                is_last_block = (block_count == len(entry.block_sizes) - 1)
-                remaining_size = entry.original_size % self._MAX_BLOCK_SIZE
+        for block_index, block_size in enumerate(entry.block_sizes):
+            if block_size == 0:
+                block_size = self._MAX_BLOCK_SIZE
 
-                if (block_size == self._MAX_BLOCK_SIZE or (is_last_block and block_size == remaining_size)):
-                    out_file.write(block_data)
-                else:
-                    decompressed_data = zlib.decompress(block_data)
-                    out_file.write(decompressed_data)
+            if self._read_into(block_offset, scratch_view[:block_size]) < block_size:
+                raise EOFError("Unexpected EOF reading data block")
 
-                block_count += 1
+            if self._is_stored_block(entry, block_index, block_size):
+                out_file.write(scratch_view[:block_size])
+            else:
+                out_file.write(zlib.decompress(scratch_view[:block_size], bufsize = self._MAX_BLOCK_SIZE))
+
+            block_offset += block_size
 
     @staticmethod
     def _read_null_string_lower(data: bytes, offset: int) -> str:
@@ -174,6 +277,17 @@ class ArchiveReader:
 
         return data[offset:end].decode("utf-8", errors = "replace").lower()
 
+    @staticmethod
+    def _split_null_strings_lower(data: bytes) -> Dict[int, str]:
+        """Split null-terminated strings from byte data, mapping each start offset to the lowercase string."""
+        strings = {}
+        offset = 0
+        for raw in data.split(b"\0"):
+            strings[offset] = raw.decode("utf-8", errors = "replace").lower()
+            offset += len(raw) + 1
+
+        return strings
+
 def get_archives(folder: Path) -> list[Path]:
     """Return a list of all archives in the given folder."""
     if not folder.exists() or not folder.is_dir():
@@ -11,6 +11,7 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+from .Exporter import ArchiveExporter
 from .Model import ArchiveColumn, TreeNode
 
 
@@ -26,6 +27,9 @@ class ArchiveView(QTreeView):
         self.customContextMenuRequested.connect(self._show_context_menu)
         self._last_export_dir = None
         self._model = None
+        self._exporter: ArchiveExporter | None = None
+        self._export_progress: QProgressDialog | None = None
+        QCoreApplication.instance().aboutToQuit.connect(self.stop_export)
 
     def _setup_view(self):
         """Setup view appearance and default sorting."""
@@ -76,40 +80,54 @@ class ArchiveView(QTreeView):
             QMessageBox.information(self, "Export", "No files to export.")
             return
 
-        progress = QProgressDialog("Exporting files...", "Cancel", 0, len(files_to_export), self)
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.show()
+        self._export_progress = QProgressDialog("Exporting files...", "Cancel", 0, len(files_to_export), self)
+        self._export_progress.setWindowModality(Qt.WindowModality.WindowModal)
 
-        exported_count = 0
-        failed_files = []
+        self._exporter = ArchiveExporter(self._model._reader, files_to_export, export_path)
+        self._exporter.progress.connect(self._on_export_progress_callback)
+        self._exporter.completed.connect(self._on_export_completed_callback)
+        self._exporter.finished.connect(self._exporter.deleteLater)
+        self._export_progress.canceled.connect(self._exporter.cancel)
 
-        with self._model._reader as reader:
-            for i, file_node in enumerate(files_to_export):
-                if progress.wasCanceled():
-                    break
+        self._export_progress.show()
+        self._exporter.start()
 
-                progress.setLabelText(f"Exporting: {file_node.name}")
-                progress.setValue(i)
-                QCoreApplication.processEvents()
+    def stop_export(self):
+        """Cancel a running export and wait for it, so the exporter thread doesn't outlive the view."""
+        exporter = self._exporter
+        if exporter is None:
+            return
+
+        self._exporter = None
+        exporter.progress.disconnect(self._on_export_progress_callback)
+        exporter.completed.disconnect(self._on_export_completed_callback)
+        exporter.cancel()
+        exporter.wait()
+
+        if self._export_progress is not None:
+            self._export_progress.close()
+            self._export_progress = None
 
-                try:
-                    relative_path = file_node.path()
-                    output_file = export_path / Path(relative_path)
-                    output_file.parent.mkdir(parents = True, exist_ok = True)
+    def _on_export_progress_callback(self, value: int, name: str):
+        """Called periodically while files are being exported."""
+        if self._export_progress is not None:
+            self._export_progress.setLabelText(f"Exporting: {name}")
+            self._export_progress.setValue(value)
 
-                    reader.unpack_file(relative_path, output_file)
+    def _on_export_completed_callback(self, exported_count: int, failed_files: list[str]):
+        """Called when exporting is complete."""
+        export_path = self._exporter.export_path
+        total_count = self._exporter.total_count
+        self._exporter = None
 
-                    exported_count += 1
-                except Exception as e:
-                    failed_files.append(f"{relative_path} ({str(e)})")
+        self._export_progress.close()
+        self._export_progress = None
 
-        progress.close()
         if failed_files:
             log_path = export_path / "export.log"
             with open(log_path, "w", encoding = "utf-8") as log_file:
                 log_file.write("\n".join(failed_files))
 
-            total_count = len(files_to_export)
             fail_count = len(failed_files)
             QMessageBox.warning(self, "Export Complete",
                                 f"Only {total_count - fail_count} of {total_count} files were exported successfully.\n"
@@ -140,5 +158,6 @@ class ArchiveView(QTreeView):
         for index in indexes:
             node = self._model.get_node(index)
             if node:
+                self._model.fetch_all(index)
                 collect(node)
         return files
@@ -1,6 +1,7 @@
+from functools import partial
 from pathlib import Path
 
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import QCoreApplication, Qt, QThread, pyqtSignal, qWarning
 from PyQt6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
@@ -16,12 +17,34 @@ from .Reader import ArchiveReader, get_archives
 from .View import ArchiveView
 
 
+def _stop_thread(thread: QThread, *_):
+    """Quit the thread's event loop and wait until it has finished."""
+    thread.quit()
+    thread.wait()
+
 class ArchiveContainerWidget(QWidget):
+    load_requested = pyqtSignal(object, int)
+
     def __init__(self, content_path: Path, parent: QWidget | None = None):
         super().__init__(parent)
         self._content_path = content_path
         self._current_content: ArchiveContentWidget | None = None
-        self._loader = None
+        self._load_generation = 0
+
+        # Single loader worker living on its own thread for the whole widget lifetime.
+        self._loader = ArchiveLoader()
+        # Not parented to the widget, so it can still be stopped once the widget is being destroyed.
+        self._loader_thread = QThread()
+        self._loader.moveToThread(self._loader_thread)
+        self.load_requested.connect(self._loader.load)
+        self._loader.finished.connect(self._on_load_finished_callback)
+        self._loader.error.connect(self._on_load_error_callback)
+        self._loader_thread.finished.connect(self._loader.deleteLater)
+        self._loader_thread.start()
+        # Bound to the thread instead of the widget, so it still runs when the widget is already gone.
+        stop_loader_thread = partial(_stop_thread, self._loader_thread)
+        self.destroyed.connect(stop_loader_thread)
+        QCoreApplication.instance().aboutToQuit.connect(stop_loader_thread)
 
         v_layout = QVBoxLayout(self)
         v_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -48,13 +71,12 @@ class ArchiveContainerWidget(QWidget):
         self._combo_box.blockSignals(False)
 
     def _clear_current_content(self):
-        if self._loader and self._loader.isRunning():
-            self._loader.finished.disconnect()
-            self._loader.error.disconnect()
-            self._loader.quit()
-            self._loader = None
+        # Pending and in-flight loads are ignored from now on.
+        self._load_generation += 1
+        self._loader.generation = self._load_generation
 
         if self._current_content:
+            self._current_content.stop_export()
             self._current_content.setParent(None)
             self._current_content.deleteLater()
             self._current_content = None
@@ -68,25 +90,20 @@ class ArchiveContainerWidget(QWidget):
         self._current_content = ArchiveContentWidget()
         self._content.addWidget(self._current_content)
 
-        self._loader = ArchiveLoader(archive_path)
-        self._loader.finished.connect(self._on_load_finished_callback)
-        self._loader.error.connect(self._on_load_error_callback)
-        self._loader.start()
+        self.load_requested.emit(archive_path, self._load_generation)
 
-    def _on_load_finished_callback(self, reader: ArchiveReader):
+    def _on_load_finished_callback(self, reader: ArchiveReader, generation: int):
         """Called when archive loading is complete."""
+        if generation != self._load_generation:
+            return
+
         if self._current_content:
             self._current_content.load_data(reader)
 
-        if self._loader:
-            self._loader.deleteLater()
-            self._loader = None
-
-    def _on_load_error_callback(self, error_msg):
+    def _on_load_error_callback(self, error_msg: str, generation: int):
         """Called when archive loading fails."""
-        if self._loader:
-            self._loader.deleteLater()
-            self._loader = None
+        if generation == self._load_generation:
+            qWarning(f"Failed to load archive: {error_msg}")
 
     def showEvent(self, event):
         super().showEvent(event)
@@ -112,3 +129,6 @@ class ArchiveContentWidget(QWidget):
 
     def load_data(self, reader: ArchiveReader):
         self._model.set_data(reader)
+
+    def stop_export(self):
+        self._view.stop_export()
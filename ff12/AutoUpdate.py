@@ -1,36 +1,108 @@
 import errno
+import io
 import json
 import os
 import re
 import shutil
-import socket
-import sys
-import tempfile
-import urllib.request
-import zipfile
+from functools import lru_cache
+from operator import itemgetter
 from typing import Callable
 
 import mobase
 from PyQt6.QtCore import (
+    QCoreApplication,
     QDateTime,
     QObject,
+    QThread,
     pyqtSignal,
     qInfo,
     qWarning,
 )
 from PyQt6.QtWidgets import (
-    QApplication,
     QDialog,
     QDialogButtonBox,
     QLabel,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QTextBrowser,
     QVBoxLayout,
 )
 
 from .DateHelper import get_date_from_iso, get_date_time_from_iso
 
+# Releases fetched from GitHub are reused for this long before asking GitHub again.
+UPDATE_CHECK_TTL_SECONDS = 6 * 60 * 60
+# Update packages up to this size are downloaded into memory instead of a temporary file.
+MAX_IN_MEMORY_DOWNLOAD_SIZE = 50 * 1024 * 1024
+# Update packages are downloaded in chunks of this size, reporting progress after each one.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Backups kept from failed installs are left this long for restoring by hand before they're removed.
+STALE_UPDATE_BACKUP_SECONDS = 7 * 24 * 60 * 60
+
+
+@lru_cache(maxsize=1)
+def _https_opener():
+    """
+    Opener shared by all GitHub requests. Without it, every connection creates a new TLS context and
+    loads the system CA certificates again before the handshake can even start.
+    """
+    import ssl
+    import urllib.request
+
+    return urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl.create_default_context()))
+
+
+class _BackgroundTask(QThread):
+    """Runs a function in a background thread and reports its result through signals."""
+    succeeded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, task: Callable[[], object]):
+        super().__init__()
+        self._task = task
+        # Don't let Qt tear the thread down while it's still running when MO2 closes.
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.wait)
+
+    def run(self):
+        try:
+            result = self._task()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit(result)
+
+class UpdateDialog(QDialog):
+    """Shows the patch notes of an available update and lets the user choose what to do with it."""
+    skip_update = pyqtSignal()
+    remind_later = pyqtSignal()
+
+    def __init__(self, plugin_name, notes_md, current_version, latest_tag, latest_date_str, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"{plugin_name} Update Available")
+        self.setMinimumSize(500, 400)
+        layout = QVBoxLayout(self)
+        infoLabel = QLabel(f"A new version of {plugin_name} is available!")
+        infoLabel.setStyleSheet("font-weight: bold; font-size: 14pt;")
+        layout.addWidget(infoLabel)
+        versionLabel = QLabel(f"Current version: {current_version}\nNew version: {latest_tag} ({latest_date_str})\n\nPatch notes:")
+        layout.addWidget(versionLabel)
+        browser = QTextBrowser()
+        browser.setMarkdown(notes_md)
+        browser.setOpenExternalLinks(True)
+        layout.addWidget(browser)
+        button_box = QDialogButtonBox()
+        update_btn = button_box.addButton("Update now", QDialogButtonBox.ButtonRole.AcceptRole)
+        remind_btn = button_box.addButton("Remind me later", QDialogButtonBox.ButtonRole.DestructiveRole)
+        skip_btn = button_box.addButton("Skip this version", QDialogButtonBox.ButtonRole.RejectRole)
+        cancel_btn = button_box.addButton("Cancel", QDialogButtonBox.ButtonRole.RejectRole)
+        layout.addWidget(button_box)
+        update_btn.clicked.connect(self.accept)
+        remind_btn.clicked.connect(self.remind_later.emit)
+        skip_btn.clicked.connect(self.skip_update.emit)
+        cancel_btn.clicked.connect(self.close)
 
 class UpdateChecker(QObject):
     """
@@ -46,13 +118,14 @@ class UpdateChecker(QObject):
         Instantiate UpdateChecker with the required parameters, set needed callbacks, and call check_for_update().
     """
     update_installed = pyqtSignal()
+    download_progress = pyqtSignal(int, int)
     update_remind = pyqtSignal(int)
     version_skipped = pyqtSignal(str)
 
     def __init__(self, name: str, repo_owner: str, repo_name: str, major: int, minor: int, patch: int, release_type: int,
                  parent: QMainWindow = None,
                  update_targets: list[str]=None, remove_targets: list[str]=None, skip_version: str=None,
-                 plugin_dir: str=None):
+                 plugin_dir: str=None, cache_path: str=None, skip_until: int=None, github_token: str=None):
         """
         Initializes the AutoUpdate class with plugin and repository information.
 
@@ -69,6 +142,9 @@ class UpdateChecker(QObject):
             remove_targets (optional): List of targets to remove. Defaults to None.
             skip_version (optional): Version to skip during update checks. Defaults to None.
             plugin_dir (optional): Directory where the plugin is located. Defaults to None.
+            cache_path (optional): File used to cache fetched releases between sessions. Defaults to None (no caching).
+            skip_until (optional): Time (in seconds since epoch) until which update checks are skipped. Defaults to None.
+            github_token (optional): GitHub access token for API requests, raising the rate limit. Defaults to None (unauthenticated).
         """
         super().__init__()
         self.name = name
@@ -81,6 +157,18 @@ class UpdateChecker(QObject):
         self.remove_targets = remove_targets
         self.skip_version = skip_version
         self.plugin_dir = plugin_dir
+        self.cache_path = cache_path
+        self.skip_until = skip_until
+        self.github_token = github_token
+        self._skip_version_val = skip_version
+        self._fetch_task = None
+        self._install_task = None
+        self._download_progress = None
+        self.download_progress.connect(self._on_download_progress)
+        # Releases fetched this session along with the time they were checked, so the disk cache is only read once.
+        self._releases = None
+        self._releases_checked = 0
+        self._cache_file_data = None
 
     def on_update_installed(self, callback: Callable[[], None]):
         """
@@ -109,14 +197,127 @@ class UpdateChecker(QObject):
         """
         self.version_skipped.connect(callback)
 
-    def _get_releases(self):
-        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/releases"
+    _cached_release_fields = ('tag_name', 'prerelease', 'body', 'published_at', 'assets')
+    _cached_asset_fields = ('name', 'browser_download_url')
+
+    def _load_cache(self) -> dict:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if not isinstance(cache, dict):
+                raise ValueError("unexpected cache format")
+            # Kept for saving, so the file doesn't have to be read again just to preserve other repositories.
+            self._cache_file_data = cache
+            repo_cache = cache.get(f"{self.repo_owner}/{self.repo_name}", {})
+            if not self._is_valid_repo_cache(repo_cache):
+                raise ValueError("unexpected cache format")
+            return repo_cache
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            qWarning(f"Failed to read update cache: {e}")
+            return {}
+
+    @staticmethod
+    def _is_valid_repo_cache(repo_cache) -> bool:
+        """Checks the fields used from a repository's cache entry, which may be hand-edited or from an older version."""
+        if not isinstance(repo_cache, dict):
+            return False
+        releases = repo_cache.get('releases', [])
+        if not isinstance(releases, list) or not all(map(UpdateChecker._is_valid_cached_release, releases)):
+            return False
+        last_checked = repo_cache.get('last_checked', 0)
+        if isinstance(last_checked, bool) or not isinstance(last_checked, (int, float)):
+            return False
+        latest = repo_cache.get('latest', {})
+        if not isinstance(latest, dict):
+            return False
+        if 'release' in latest and not UpdateChecker._is_valid_cached_release(latest['release']):
+            return False
+        # Both are saved as None when GitHub didn't send them.
+        return all(
+            isinstance(entry.get(key), (str, type(None)))
+            for entry in (repo_cache, latest)
+            for key in ('etag', 'last_modified')
+        )
+
+    @staticmethod
+    def _is_valid_cached_release(release) -> bool:
+        return isinstance(release, dict) and isinstance(release.get('tag_name', ''), str)
+
+    def _save_cache(self, repo_cache: dict):
+        if not self.cache_path:
+            return
+        try:
+            cache = self._cache_file_data
+            if cache is None:
+                try:
+                    with open(self.cache_path, "r", encoding="utf-8") as f:
+                        cache = json.load(f)
+                except (OSError, ValueError):
+                    cache = {}
+                if not isinstance(cache, dict):
+                    cache = {}
+            cache[f"{self.repo_owner}/{self.repo_name}"] = repo_cache
+            self._cache_file_data = cache
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            # Write next to the cache and swap it in, so an interrupted write can't leave a truncated cache behind.
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            qWarning(f"Failed to write update cache: {e}")
+
+    def _strip_release(self, release):
+        # Only keep what's needed, so the cache stays small.
+        stripped = {k: release[k] for k in self._cached_release_fields if k in release}
+        stripped['assets'] = [
+            {k: asset[k] for k in self._cached_asset_fields if k in asset}
+            for asset in release.get('assets', [])
+        ]
+        return stripped
+
+    def _request_github(self, path, cached):
+        """
+        Requests a GitHub API path, conditionally if `cached` holds an ETag or Last-Modified from an earlier response.
+
+        Returns:
+            tuple: (data, etag, last_modified), where data is None if GitHub answered that nothing changed (304).
+        """
+        # Network modules are only needed when GitHub is actually asked, so they're imported here.
+        import gzip
+        import socket
+        import urllib.request
+
+        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/{path}"
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'Accept-Encoding': 'gzip',
+            'X-GitHub-Api-Version': '2022-11-28',
+            'User-Agent': f"{self.repo_owner}-{self.repo_name}",
+        }
+        if self.github_token:
+            headers['Authorization'] = f"Bearer {self.github_token}"
+        # Conditional request, unchanged releases are answered with 304 which doesn't count against the rate limit.
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        request = urllib.request.Request(url, headers=headers)
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
+            with _https_opener().open(request, timeout=10) as response:
                 data = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    data = gzip.decompress(data)
+                return json.loads(data), response.headers.get('ETag'), response.headers.get('Last-Modified')
         except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise Exception(f"GitHub repository {self.repo_owner}/{self.repo_name} not found (404).")
+            if e.code == 304:
+                return None, cached.get('etag'), cached.get('last_modified')
+            elif e.code == 404:
+                raise FileNotFoundError(f"GitHub repository {self.repo_owner}/{self.repo_name} not found (404).")
             elif e.code == 403:
                 raise Exception("GitHub API rate limit exceeded (403). Please try again later.")
             else:
@@ -126,136 +327,172 @@ class UpdateChecker(QObject):
         except socket.timeout:
             raise Exception("Connection timed out while trying to fetch releases.")
 
-        releases = json.loads(data)
-        return releases
+    def _get_latest_final_release(self, cache):
+        """
+        Fetches only the latest final release, updating its entry in `cache`.
 
-    def _parse_version(self, tag):
-        # Handles tags like v1.2.3, 1.2.3, v1.2.3-suffix, 1.2.3-suffix
-        tag = tag.lstrip('v')
-        # Remove any suffix after patch number before checking version
-        main_part = tag.split('-')[0]
-        parts = main_part.split('.')
-        if len(parts) < 3:
-            return None
+        Returns:
+            dict | None: The latest final release, or None if the repository has none.
+        """
+        cached = cache.get('latest', {})
         try:
-            return tuple(int(p) for p in parts[:3])
-        except Exception:
+            data, etag, last_modified = self._request_github("releases/latest", cached if 'release' in cached else {})
+        except FileNotFoundError:
+            # GitHub answers 404 when there's no final release yet.
             return None
+        release = cached['release'] if data is None else self._strip_release(data)
+        cache['latest'] = {'etag': etag, 'last_modified': last_modified, 'release': release}
+        return release
 
-    def _is_newer(self, v1, v2):
-        if v2 is None:
-            return True
-        if v1 is None:
-            return False
-        return v1 > v2
+    def _get_cached_releases(self):
+        """
+        Looks for releases checked within the last UPDATE_CHECK_TTL_SECONDS.
 
-    def check_for_update(self, skip_version=None):
+        Returns:
+            tuple: (releases, cache), where releases is None if they have to be fetched, and cache is the repository's
+            cache entry read from disk to pass on to _get_releases, or None if it wasn't needed.
+        """
+        now_secs = QDateTime.currentDateTime().toSecsSinceEpoch()
+        if self._releases is not None and 0 <= now_secs - self._releases_checked < UPDATE_CHECK_TTL_SECONDS:
+            return self._releases, None
+
+        cache = self._load_cache()
+        if 'releases' in cache and 0 <= now_secs - cache.get('last_checked', 0) < UPDATE_CHECK_TTL_SECONDS:
+            self._releases, self._releases_checked = cache['releases'], cache['last_checked']
+            return self._releases, cache
+
+        return None, cache
+
+    def _get_releases(self, cache: dict):
+        """Fetches releases from GitHub, conditionally based on the repository's cache entry `cache`."""
+        now_secs = QDateTime.currentDateTime().toSecsSinceEpoch()
+
+        # Final releases only need the single latest one to tell if there's an update,
+        # the whole list (with the patch notes) is only fetched if there is one.
+        if self.release_type == mobase.ReleaseType.FINAL:
+            latest = self._get_latest_final_release(cache)
+            latest_ver = self._parse_version(latest.get('tag_name', '')) if latest else None
+            if latest_ver is None or latest_ver <= self.current_version:
+                releases = cache.get('releases') or ([latest] if latest else [])
+                cache['last_checked'] = now_secs
+                cache['releases'] = releases
+                self._save_cache(cache)
+                self._releases, self._releases_checked = releases, now_secs
+                return releases
+
+        data, etag, last_modified = self._request_github("releases", cache if 'releases' in cache else {})
+        releases = cache['releases'] if data is None else [self._strip_release(rel) for rel in data]
+        cache.update({'last_checked': now_secs, 'etag': etag, 'last_modified': last_modified, 'releases': releases})
+        self._save_cache(cache)
+        self._releases, self._releases_checked = releases, now_secs
+        return releases
+
+    # Handles tags like v1.2.3, 1.2.3, v1.2.3-suffix, 1.2.3-suffix
+    _version_pattern = re.compile(r'v*(\d+)\.(\d+)\.(\d+)(?:[-.]|$)')
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_version(tag):
+        match = UpdateChecker._version_pattern.match((tag or '').strip())
+        if match is None:
+            return None
+        return tuple(map(int, match.groups()))
+
+    def check_for_update(self, skip_version=None, skip_until=None):
         """
         Checks GitHub for available updates and prompts the user if a new version is found.
 
         Args:
             skip_version (str, optional): Version to skip during update checks. If none, the value passed to constructor will be used.
+            skip_until (int, optional): Time (in seconds since epoch) until which update checks are skipped. If none, the value passed to constructor will be used.
         """
+        skip_until_val = skip_until if skip_until is not None else self.skip_until
+        if skip_until_val and QDateTime.currentDateTime().toSecsSinceEpoch() < skip_until_val:
+            self._log_remind_later()
+            return
+
+        if self._fetch_task is not None and self._fetch_task.isRunning():
+            return
+        self._skip_version_val = skip_version if skip_version is not None else self.skip_version
+
+        # Most starts fall within the last check's TTL, and those don't need a thread at all.
+        releases, cache = self._get_cached_releases()
+        if releases is not None:
+            self._on_releases_loaded(releases)
+            return
+
         # GitHub API has 60 requests per hour limit for unauthenticated requests.
         # So let's not make a big fuss about it and handle errors gracefully.
-        try:
-            releases = self._get_releases()
-        except Exception as e:
-            qInfo(f"Failed to fetch releases: {e}")
-            return
-        include_prerelease = self.release_type != mobase.ReleaseType.FINAL
-        latest = None
-        skip_version_val = skip_version if skip_version is not None else self.skip_version
+        # Fetching happens in background, so MO2 stays responsive.
+        self._fetch_task = _BackgroundTask(lambda: self._get_releases(cache))
+        self._fetch_task.succeeded.connect(self._on_releases_loaded)
+        self._fetch_task.failed.connect(self._on_releases_failed)
+        self._fetch_task.start()
 
-        for rel in releases:
-            if not include_prerelease and rel.get('prerelease', False):
-                continue
-            tag = rel.get('tag_name', '')
-            ver = self._parse_version(tag)
-            if ver and self._is_newer(ver, self.current_version):
-                if latest is None or self._is_newer(ver, self._parse_version(latest['tag_name'])):
-                    latest = rel
-
-        if latest:
-            latest_ver = self._parse_version(latest.get('tag_name'))
+    def _on_releases_failed(self, error: str):
+        qInfo(f"Failed to fetch releases: {error}")
+
+    def _newer_releases(self, releases):
+        """Returns (version, release) pairs of releases newer than the current version."""
+        include_prerelease = self.release_type != mobase.ReleaseType.FINAL
+        parse_version = self._parse_version
+        current_version = self.current_version
+        # GitHub lists releases by creation date, so a backport can come before newer versions and every one is checked.
+        return [
+            (ver, rel) for rel in releases
+            if (include_prerelease or not rel.get('prerelease', False))
+            and (ver := parse_version(rel.get('tag_name', ''))) is not None
+            and ver > current_version
+        ]
+
+    def _on_releases_loaded(self, releases):
+        skip_version_val = self._skip_version_val
+        candidates = self._newer_releases(releases)
+
+        if candidates:
+            # Sorted newest first once here, the changelog lists them in the same order.
+            candidates.sort(key=itemgetter(0), reverse=True)
+            latest_ver, latest = candidates[0]
+            # Versions are plain tuples, an unparsable skip version skips nothing.
             skip_ver = self._parse_version(skip_version_val)
-            if not self._is_newer(latest_ver, skip_ver):
+            if skip_ver is not None and latest_ver <= skip_ver:
                 self._log_skip_update()
             else:
-                self._show_update_dialog(latest)
+                self._show_update_dialog(latest, candidates)
         else:
             self._log_no_update()
 
     _pr_pattern = re.compile(r'(?<![\w/])#(\d+)')
     def _make_pr_links(self, text: str) -> str:
+        # A template instead of a function, so the replacement doesn't call back into Python for every match.
         return self._pr_pattern.sub(
-            lambda m: f"[#{m.group(1)}](https://github.com/{self.repo_owner}/{self.repo_name}/pull/{m.group(1)})",
+            rf"[#\1](https://github.com/{self.repo_owner}/{self.repo_name}/pull/\1)",
             text
         )
 
-    def _collect_changelogs(self, latest_release):
+    def _collect_changelogs(self, latest_release, newer_releases):
         try:
-            all_releases = self._get_releases()
-            include_prerelease = self.release_type != mobase.ReleaseType.FINAL
-            current_ver = self.current_version
-            changelogs = []
-            for rel in all_releases:
-                if not include_prerelease and rel.get('prerelease', False):
-                    continue
-                tag = rel.get('tag_name', '')
-                ver = self._parse_version(tag)
-                if ver and self._is_newer(ver, current_ver):
-                    body = rel.get('body', 'No patch notes.')
-                    body = self._make_pr_links(body)
-                    changelogs.append((ver, tag, body, rel.get('published_at', '')))
-            changelogs.sort(reverse=True)
-            notes_md = ""
-            for i, (ver, tag, body, published_at) in enumerate(changelogs):
-                notes_md += f"## Changes in {tag} []()  Date: {get_date_from_iso(published_at)} ([commits](https://github.com/{self.repo_owner}/{self.repo_name}/commits/{tag}))\n{body}"
-                if i < len(changelogs) - 1:
-                    notes_md += "\n***\n"
-                else:
-                    notes_md += "\n"
-            if not notes_md:
+            make_pr_links = self._make_pr_links
+            commits_url = f"https://github.com/{self.repo_owner}/{self.repo_name}/commits/"
+            changelogs = [
+                (ver, rel.get('tag_name', ''), make_pr_links(rel.get('body', 'No patch notes.')), rel.get('published_at', ''))
+                for ver, rel in newer_releases
+            ]
+            notes_md = "\n***\n".join(
+                f"## Changes in {tag} []()  Date: {get_date_from_iso(published_at)} ([commits]({commits_url}{tag}))\n{body}"
+                for ver, tag, body, published_at in changelogs
+            )
+            if notes_md:
+                notes_md += "\n"
+            else:
                 body = latest_release.get('body', 'No patch notes.')
                 body = self._make_pr_links(body)
-                notes_md = f"## Changes in {latest_release.get('tag_name', '')} []()  Date: {get_date_from_iso(latest_release.get('published_at', ''))} ([commits](https://github.com/{self.repo_owner}/{self.repo_name}/commits/{latest_release.get('tag_name', '')}))\n{body}\n"
+                notes_md = f"## Changes in {latest_release.get('tag_name', '')} []()  Date: {get_date_from_iso(latest_release.get('published_at', ''))} ([commits]({commits_url}{latest_release.get('tag_name', '')}))\n{body}\n"
             return notes_md
         except Exception as e:
             qWarning(f"Failed to collect changelogs: {e}")
             return "## Error collecting changelogs\nAn error occurred while fetching the changelogs. Please check the log for details."
 
-    def _create_update_dialog(self, notes_md, current_version, latest_tag, latest_date_str):
-        pluginName = self.name or "Plugin"
-        class UpdateDialog(QDialog):
-            skip_update = pyqtSignal()
-            remind_later = pyqtSignal()
-            def __init__(self, parent=None):
-                super().__init__(parent)
-                self.setWindowTitle(f"{pluginName} Update Available")
-                self.setMinimumSize(500, 400)
-                layout = QVBoxLayout(self)
-                infoLabel = QLabel(f"A new version of {pluginName} is available!")
-                infoLabel.setStyleSheet("font-weight: bold; font-size: 14pt;")
-                layout.addWidget(infoLabel)
-                versionLabel = QLabel(f"Current version: {current_version}\nNew version: {latest_tag} ({latest_date_str})\n\nPatch notes:")
-                layout.addWidget(versionLabel)
-                browser = QTextBrowser()
-                browser.setMarkdown(notes_md)
-                browser.setOpenExternalLinks(True)
-                layout.addWidget(browser)
-                button_box = QDialogButtonBox()
-                update_btn = button_box.addButton("Update now", QDialogButtonBox.ButtonRole.AcceptRole)
-                remind_btn = button_box.addButton("Remind me later", QDialogButtonBox.ButtonRole.DestructiveRole)
-                skip_btn = button_box.addButton("Skip this version", QDialogButtonBox.ButtonRole.RejectRole)
-                cancel_btn = button_box.addButton("Cancel", QDialogButtonBox.ButtonRole.RejectRole)
-                layout.addWidget(button_box)
-                update_btn.clicked.connect(self.accept)
-                remind_btn.clicked.connect(self.remind_later.emit)
-                skip_btn.clicked.connect(self.skip_update.emit)
-                cancel_btn.clicked.connect(self.close)
-        return UpdateDialog
-
     def _connect_update_dialog(self, dialog, latest_release, latest_tag):
         def on_accept():
             self._download_and_update(latest_release)
@@ -271,14 +508,12 @@ class UpdateChecker(QObject):
         dialog.skip_update.connect(on_skip)
         dialog.remind_later.connect(on_remind)
 
-    def _show_update_dialog(self, latest_release):
-        notes_md = self._collect_changelogs(latest_release)
+    def _show_update_dialog(self, latest_release, newer_releases):
+        notes_md = self._collect_changelogs(latest_release, newer_releases)
         current_version = f"v{self.current_version[0]}.{self.current_version[1]}.{self.current_version[2]}"
         latest_tag = latest_release.get('tag_name', '')
         latest_date_str = get_date_time_from_iso(latest_release.get('published_at', ''))
-        _app = QApplication.instance() or QApplication(sys.argv)
-        UpdateDialog = self._create_update_dialog(notes_md, current_version, latest_tag, latest_date_str)
-        dialog = UpdateDialog(parent=self.parentWindow)
+        dialog = UpdateDialog(self.name or "Plugin", notes_md, current_version, latest_tag, latest_date_str, parent=self.parentWindow)
         dialog.activateWindow()
         dialog.raise_()
         self._connect_update_dialog(dialog, latest_release, latest_tag)
@@ -290,73 +525,180 @@ class UpdateChecker(QObject):
     def _log_skip_update(self):
         qInfo(f"Skipped update for {self.name}.")
 
+    def _log_remind_later(self):
+        qInfo(f"Skipped update check for {self.name} until later.")
+
     def _download_and_update(self, release):
         asset = self._find_zip_asset(release)
         if not asset:
             self._show_error("No zip asset found in release.")
             return
-        tmpdir = tempfile.mkdtemp()
+        if self._install_task is not None and self._install_task.isRunning():
+            return
+        self._download_progress = QProgressDialog(f"Downloading {asset['name']}...", "", 0, 0, self.parentWindow)
+        self._download_progress.setWindowTitle(f"{self.name} Update")
+        self._download_progress.setCancelButton(None)
+        self._download_progress.setAutoClose(False)
+        self._download_progress.setAutoReset(False)
+        self._download_progress.show()
+        # Downloading and replacing files happens in background, so MO2 stays responsive.
+        self._install_task = _BackgroundTask(lambda: self._install_update(asset))
+        self._install_task.succeeded.connect(self._on_install_finished)
+        self._install_task.failed.connect(self._on_install_failed)
+        self._install_task.start()
+
+    def _on_download_progress(self, done: int, total: int):
+        """Called periodically from the download thread."""
+        if self._download_progress is None:
+            return
+        # Without a known size, the dialog just shows it's busy.
+        if total > 0:
+            self._download_progress.setMaximum(total)
+            self._download_progress.setValue(min(done, total))
+
+    def _close_download_progress(self):
+        if self._download_progress is not None:
+            self._download_progress.close()
+            self._download_progress = None
+
+    def _on_install_finished(self, result):
+        self._close_download_progress()
+        error, manual_restore_dir = result
+        if manual_restore_dir is not None:
+            # Opening Explorer belongs on the UI thread, so the install task only reports where the backup is.
+            self._open_dirs_for_manual_restore(manual_restore_dir)
+        if error:
+            self._show_error(error)
+            return
+        self._show_restart_dialog()
+        self.update_installed.emit()
+
+    def _on_install_failed(self, error: str):
+        self._close_download_progress()
+        self._show_error(f"Update failed: {error}")
+
+    def _install_update(self, asset):
+        """
+        Downloads the update and replaces plugin files. Runs in a background thread.
+
+        Returns:
+            tuple: (error, manual_restore_dir), where error is the message to show to the user or None if the update
+            was installed, and manual_restore_dir is the kept backup to restore by hand or None.
+        """
+        import tempfile
+
+        try:
+            # In the plugin's own data folder next to the cache, which is inside MO2 like the plugin directory,
+            # so moving the new files in is usually a rename on the same drive.
+            work_root = os.path.join(os.path.dirname(self.cache_path), "updates") if self.cache_path else None
+            if work_root:
+                os.makedirs(work_root, exist_ok=True)
+                self._remove_stale_update_dirs(work_root)
+            tmpdir = tempfile.mkdtemp(prefix=".update-", dir=work_root)
+        except OSError:
+            tmpdir = tempfile.mkdtemp()
         zip_path = os.path.join(tmpdir, asset['name'])
         backup_dir = os.path.join(tmpdir, "backup")
+        # Set if restoring failed, the backup is kept and opened for the user from the UI thread then.
+        manual_restore_dir = None
         try:
-            self._download_asset(asset['browser_download_url'], zip_path)
-            found_targets = self._extract_update_files(zip_path, tmpdir)
-            missing = [t for t in self.update_targets if t not in found_targets]
-            if missing:
-                self._show_error(f"Update package missing: {', '.join(missing)}")
-                return
-            self._backup_targets(backup_dir)
+            zip_file = self._download_asset(asset['browser_download_url'], zip_path)
+            found_targets = self._extract_update_files(zip_file, tmpdir)
+            moved_targets = self._backup_targets(backup_dir)
             try:
                 if not self._replace_plugin_files(found_targets):
-                    self._show_error("Failed to replace plugin files, but no changes were made.")
-                    return
+                    # Remove-only targets were moved into the backup, they have to go back before it's deleted.
+                    try:
+                        self._return_moved_targets(moved_targets)
+                    except Exception as restore_exc:
+                        manual_restore_dir = backup_dir
+                        return f"Failed to replace plugin files.\nRestore also failed: {restore_exc}\nPlease copy files manually.", manual_restore_dir
+                    return "Failed to replace plugin files, but no changes were made.", None
             except Exception as e:
                 # Attempt restore if replacement fails
                 try:
                     self._restore_targets(backup_dir)
                 except Exception as restore_exc:
-                    self._show_error(f"Update failed: {e}\nRestore also failed: {restore_exc}\nPlease copy files manually.")
-                    self._open_dirs_for_manual_restore(backup_dir)
-                    return
-                self._show_error(f"Update failed: {e}\nChanges have been reverted.")
-                return
-            self._show_restart_dialog()
-            self.update_installed.emit()
+                    # Backup is needed for manual restore, so don't remove it.
+                    manual_restore_dir = backup_dir
+                    return f"Update failed: {e}\nRestore also failed: {restore_exc}\nPlease copy files manually.", manual_restore_dir
+                return f"Update failed: {e}\nChanges have been reverted.", None
+            return None, None
         except Exception as e:
-            self._show_error(f"Update failed: {e}")
+            return f"Update failed: {e}", None
         finally:
-            shutil.rmtree(tmpdir, ignore_errors=True)
+            if manual_restore_dir is None:
+                shutil.rmtree(tmpdir, ignore_errors=True)
+
+    @staticmethod
+    def _remove_stale_update_dirs(work_root):
+        """Removes update directories left behind by failed or interrupted installs."""
+        now_secs = QDateTime.currentDateTime().toSecsSinceEpoch()
+        with os.scandir(work_root) as entries:
+            for entry in entries:
+                if not entry.name.startswith(".update-") or not entry.is_dir():
+                    continue
+                # A backup may be the only copy of files a failed install already replaced,
+                # so it's kept for a while to be restored by hand.
+                if (os.path.isdir(os.path.join(entry.path, "backup"))
+                        and now_secs - entry.stat().st_mtime < STALE_UPDATE_BACKUP_SECONDS):
+                    continue
+                shutil.rmtree(entry.path, ignore_errors=True)
 
     def _backup_targets(self, backup_dir):
+        """
+        Backs up the targets, moving remove-only ones into backup_dir instead of copying them.
+
+        Returns:
+            list: (original path, backup path) pairs of the targets that were moved.
+        """
         os.makedirs(backup_dir, exist_ok=True)
         plugin_dir = self.plugin_dir
-        unique_targets = set((self.update_targets or []) + (self.remove_targets or []))
-        for target in unique_targets:
-            src_path = os.path.join(plugin_dir, target)
-            dst_path = os.path.join(backup_dir, target)
-            if os.path.exists(src_path):
+        update_targets = set(self.update_targets or [])
+        unique_targets = update_targets | set(self.remove_targets or [])
+        moved = []
+        try:
+            for target in unique_targets:
+                src_path = os.path.join(plugin_dir, target)
+                dst_path = os.path.join(backup_dir, target)
+                if target not in update_targets and os.path.exists(src_path):
+                    # Only removed by the update, so it can be moved away instead of copied.
+                    try:
+                        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+                        os.replace(src_path, dst_path)
+                        moved.append((src_path, dst_path))
+                        continue
+                    except OSError:
+                        pass
                 if os.path.isdir(src_path):
-                    shutil.copytree(src_path, dst_path)
-                else:
+                    shutil.copytree(src_path, dst_path, dirs_exist_ok=True)
+                elif os.path.isfile(src_path):
                     os.makedirs(os.path.dirname(dst_path), exist_ok=True)
                     shutil.copy2(src_path, dst_path)
+        except Exception:
+            # The update won't go on, so put back what was already moved away.
+            self._return_moved_targets(moved)
+            raise
+        return moved
+
+    def _return_moved_targets(self, moved):
+        for src_path, dst_path in moved:
+            os.replace(dst_path, src_path)
 
     def _restore_targets(self, backup_dir):
         plugin_dir = self.plugin_dir
-        for root, dirs, files in os.walk(backup_dir):
-            rel_root = os.path.relpath(root, backup_dir)
-            dest_root = os.path.join(plugin_dir, rel_root) if rel_root != '.' else plugin_dir
-            for d in dirs:
-                src_dir = os.path.join(root, d)
-                dest_dir = os.path.join(dest_root, d)
-                if os.path.exists(dest_dir):
-                    shutil.rmtree(dest_dir, ignore_errors=True)
-                shutil.copytree(src_dir, dest_dir)
-            for f in files:
-                src_file = os.path.join(root, f)
-                dest_file = os.path.join(dest_root, f)
-                os.makedirs(os.path.dirname(dest_file), exist_ok=True)
-                shutil.copy2(src_file, dest_file)
+        unique_targets = set((self.update_targets or []) + (self.remove_targets or []))
+        for target in unique_targets:
+            src_path = os.path.join(backup_dir, target)
+            dst_path = os.path.join(plugin_dir, target)
+            if not os.path.exists(src_path):
+                continue
+            # Directories are restored as a whole, so files added by the failed update don't linger.
+            if os.path.isdir(dst_path):
+                shutil.rmtree(dst_path, ignore_errors=True)
+            os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+            # The backup is on the same drive as the plugin directory, so this is usually just a rename.
+            self._move_path(src_path, dst_path)
 
     def _open_dirs_for_manual_restore(self, backup_dir):
         plugin_dir = self.plugin_dir
@@ -373,9 +715,29 @@ class UpdateChecker(QObject):
         return None
 
     def _download_asset(self, url, zip_path):
+        """
+        Downloads the asset into memory, or into zip_path if it's too large or its size is unknown.
+
+        Returns:
+            io.BytesIO | str: The downloaded zip file, usable with zipfile.ZipFile.
+        """
+        import socket
+        import urllib.request
+
         try:
-            with urllib.request.urlopen(url, timeout=10) as response, open(zip_path, 'wb') as out_file:
-                shutil.copyfileobj(response, out_file)
+            with _https_opener().open(url, timeout=10) as response:
+                size = int(response.headers.get('Content-Length') or -1)
+                if 0 <= size <= MAX_IN_MEMORY_DOWNLOAD_SIZE:
+                    zip_file = io.BytesIO()
+                    self._copy_with_progress(response, zip_file, size)
+                    zip_file.seek(0)
+                    return zip_file
+                with open(zip_path, 'wb') as out_file:
+                    # Reserve the known size up front, so the file is allocated once instead of growing per chunk.
+                    if size > 0:
+                        out_file.truncate(size)
+                    self._copy_with_progress(response, out_file, size)
+                return zip_path
         except urllib.error.HTTPError as e:
             if e.code == 404:
                 raise Exception(f"Download URL not found (404): {url}")
@@ -388,17 +750,58 @@ class UpdateChecker(QObject):
         except socket.timeout:
             raise Exception("Connection timed out while trying to download asset.")
 
-    def _extract_update_files(self, zip_path, tmpdir):
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(tmpdir)
-        found_targets = {}
-        for root, dirs, files in os.walk(tmpdir):
-            for target in self.update_targets:
-                if target in files:
-                    found_targets[target] = os.path.join(root, target)
-                if target in dirs:
-                    found_targets[target] = os.path.join(root, target)
-        return found_targets
+    def _copy_with_progress(self, response, out_file, total):
+        """
+        Copies the response in DOWNLOAD_CHUNK_SIZE chunks, reporting progress through download_progress.
+
+        Raises:
+            Exception: If the connection ended before all of the known `total` bytes were received.
+        """
+        done = 0
+        self.download_progress.emit(done, total)
+        while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+            out_file.write(chunk)
+            done += len(chunk)
+            self.download_progress.emit(done, total)
+        # A connection closed early just ends the response, which would otherwise only show up as a broken zip.
+        if total > 0 and done != total:
+            raise Exception(f"Incomplete download: received {done} of {total} bytes. Please try again later.")
+
+    def _extract_update_files(self, zip_file, tmpdir):
+        import zipfile
+
+        targets = set(self.update_targets)
+        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+            names = zip_ref.namelist()
+            # Find the shallowest archive path of each target, without extracting anything yet.
+            target_paths = {}
+            top_level_targets = set()
+            for name in names:
+                parts = name.rstrip('/').split('/')
+                for depth, part in enumerate(parts):
+                    if part in targets:
+                        known_path = target_paths.get(part)
+                        if known_path is None or depth < known_path.count('/'):
+                            target_paths[part] = '/'.join(parts[:depth + 1])
+                            if depth == 0:
+                                top_level_targets.add(part)
+                        break
+                # Nothing can be shallower than the top level.
+                if len(top_level_targets) == len(targets):
+                    break
+            # Reject an incomplete package before extracting anything from it.
+            missing = [t for t in self.update_targets if t not in target_paths]
+            if missing:
+                raise Exception(f"Update package missing: {', '.join(missing)}")
+            # Extract only the targets.
+            prefixes = tuple(f"{path}/" for path in target_paths.values())
+            paths = set(target_paths.values())
+            members = [name for name in names if name in paths or name.startswith(prefixes)]
+            zip_ref.extractall(tmpdir, members=members)
+        return {
+            target: os.path.join(tmpdir, *path.split('/'))
+            for target, path in target_paths.items()
+        }
 
     def _replace_plugin_files(self, found_targets) -> bool:
         plugin_dir = self.plugin_dir
@@ -414,14 +817,11 @@ class UpdateChecker(QObject):
                 elif os.path.isfile(target_path):
                     os.remove(target_path)
                     changes_done = True
-            # Copy new/updated targets
+            # Move new/updated targets
             for target, src_path in found_targets.items():
                 dest_path = os.path.join(plugin_dir, target)
-                if os.path.isdir(src_path):
-                    shutil.copytree(src_path, dest_path)
-                    changes_done = True
-                elif os.path.isfile(src_path):
-                    shutil.copy2(src_path, dest_path)
+                if os.path.isdir(src_path) or os.path.isfile(src_path):
+                    self._move_path(src_path, dest_path)
                     changes_done = True
         except FileNotFoundError:
             pass
@@ -435,10 +835,20 @@ class UpdateChecker(QObject):
                 return False
         return True
 
+    def _move_path(self, src_path, dest_path):
+        # Within the same drive this is just a rename, otherwise it falls back to copying.
+        if os.path.isdir(src_path):
+            if os.path.exists(dest_path):
+                raise FileExistsError(errno.EEXIST, "Destination already exists", dest_path)
+            shutil.move(src_path, dest_path)
+        else:
+            try:
+                os.replace(src_path, dest_path)
+            except OSError:
+                shutil.copy2(src_path, dest_path)
+
     def _show_error(self, msg):
-        _app = QApplication.instance() or QApplication(sys.argv)
         QMessageBox.critical(None, f"{self.name} Update", msg)
 
     def _show_restart_dialog(self):
-        _app = QApplication.instance() or QApplication(sys.argv)
         QMessageBox.information(None, f"{self.name} Update", "Update complete! Please restart Mod Organizer 2 for changes to take effect.")
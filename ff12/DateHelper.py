@@ -1,6 +1,16 @@
 from datetime import datetime
+from functools import lru_cache
 
 
+@lru_cache(maxsize = 512)
+def _format_iso(date_iso: str, date_format: str) -> str:
+    """Format ISO 8601 string, returning it unchanged if parsing fails. Cached, as releases repeat the same dates."""
+    try:
+        dt = datetime.fromisoformat(date_iso.replace("Z", "+00:00"))
+        return dt.strftime(date_format)
+    except Exception:
+        return date_iso
+
 def get_date_time_from_iso(date_iso: str) -> str:
     """
     Convert ISO 8601 string to 'YYYY-MM-DD HH:MM UTC'.
@@ -9,11 +19,7 @@ def get_date_time_from_iso(date_iso: str) -> str:
     if not isinstance(date_iso, str):
         return str(date_iso)
 
-    try:
-        dt = datetime.fromisoformat(date_iso.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d %H:%M UTC")
-    except Exception:
-        return date_iso
+    return _format_iso(date_iso, "%Y-%m-%d %H:%M UTC")
 
 def get_date_from_iso(date_iso: str) -> str:
     """
@@ -23,8 +29,4 @@ def get_date_from_iso(date_iso: str) -> str:
     if not isinstance(date_iso, str):
         return str(date_iso)
 
-    try:
-        dt = datetime.fromisoformat(date_iso.replace("Z", "+00:00"))
-        return dt.strftime("%Y-%m-%d")
-    except Exception:
-        return date_iso
+    return _format_iso(date_iso, "%Y-%m-%d")
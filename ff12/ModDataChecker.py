@@ -7,6 +7,11 @@ from ...basic_features import (
 from ...basic_features.utils import is_directory
 
 
+def _is_literal(pattern: str) -> bool:
+    """Whether the glob pattern has no wildcards, so it only matches its own name."""
+    return not any(c in pattern for c in "*?[")
+
+
 class FF12ModDataChecker(BasicModDataChecker):
     def __init__(self):
         super().__init__(
@@ -24,56 +29,86 @@ class FF12ModDataChecker(BasicModDataChecker):
                       },
             )
         )
+        # Plain valid and move names are looked up directly, only actual globs (e.g. from the defaults) are matched.
+        valid = self._file_patterns.valid or []
+        move = self._file_patterns.move or {}
+        self._valid_names = frozenset(name.casefold() for name in valid if _is_literal(name))
+        self._move_targets = {name.casefold(): target for name, target in move.items() if _is_literal(name)}
+        self._has_valid_globs = not all(map(_is_literal, valid))
+        self._has_move_globs = not all(map(_is_literal, move))
 
     def dataLooksValid(
         self, filetree: mobase.IFileTree
     ) -> mobase.ModDataChecker.CheckReturn:
-        status = mobase.ModDataChecker.VALID
+        VALID = mobase.ModDataChecker.VALID
+        FIXABLE = mobase.ModDataChecker.FIXABLE
+        INVALID = mobase.ModDataChecker.INVALID
+        status = VALID
 
         rp = self._regex_patterns
+        unfold_match = rp.unfold.match
+        delete_match = rp.delete.match
+        valid_names = self._valid_names
+        move_targets = self._move_targets
+        has_valid_globs = self._has_valid_globs
+        has_move_globs = self._has_move_globs
         for entry in filetree:
             name = entry.name().casefold()
 
-            if rp.valid.match(name):
-                if status is mobase.ModDataChecker.INVALID:
-                    status = mobase.ModDataChecker.VALID
+            if name in valid_names or (has_valid_globs and rp.valid.match(name)):
+                if status is INVALID:
+                    status = VALID
 
-            elif rp.move_match(name) is not None:
-                status = mobase.ModDataChecker.FIXABLE
+            elif name in move_targets or (has_move_globs and rp.move_match(name) is not None):
+                status = FIXABLE
 
-            elif rp.unfold.match(name) and is_directory(entry):
-                status = mobase.ModDataChecker.FIXABLE
+            elif unfold_match(name) and is_directory(entry):
+                status = FIXABLE
                 new_status = self.dataLooksValid(entry)
-                if new_status is not mobase.ModDataChecker.VALID:
+                if new_status is not VALID:
                     status = new_status
 
-            elif rp.delete.match(name) is not None:
-                status = mobase.ModDataChecker.FIXABLE
+            elif delete_match(name) is not None:
+                status = FIXABLE
 
             else:
-                status = mobase.ModDataChecker.INVALID
+                status = INVALID
                 break
         return status
 
     def fix(self, filetree: mobase.IFileTree) -> mobase.IFileTree:
         rp = self._regex_patterns
-
-        for entry in list(filetree):
-            name = entry.name().casefold()
-
-            if rp.valid.match(name):
-                continue
-
-            elif (move_key := rp.move_match(name)) is not None:
-                target = self._file_patterns.move[move_key]
-                filetree.move(entry, target)
-
-            elif rp.unfold.match(name) and is_directory(entry):
-                filetree.merge(entry)
-                entry.detach()
-                self.fix(filetree)
-
-            elif rp.delete.match(name):
-                entry.detach()
+        unfold_match = rp.unfold.match
+        delete_match = rp.delete.match
+        valid_names = self._valid_names
+        move_targets = self._move_targets
+        has_valid_globs = self._has_valid_globs
+        has_move_globs = self._has_move_globs
+
+        # Unfolded directories are merged into the tree and their contents handled in the next pass,
+        # instead of starting over for each of them.
+        unfolded = True
+        while unfolded:
+            unfolded = False
+            for entry in list(filetree):
+                name = entry.name().casefold()
+
+                if name in valid_names or (has_valid_globs and rp.valid.match(name)):
+                    continue
+
+                target = move_targets.get(name)
+                if target is None and has_move_globs and (move_key := rp.move_match(name)) is not None:
+                    target = self._file_patterns.move[move_key]
+
+                if target is not None:
+                    filetree.move(entry, target)
+
+                elif unfold_match(name) and is_directory(entry):
+                    filetree.merge(entry)
+                    entry.detach()
+                    unfolded = True
+
+                elif delete_match(name):
+                    entry.detach()
 
         return filetree
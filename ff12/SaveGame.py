@@ -1,4 +1,6 @@
+import os
 from collections.abc import Mapping
+from functools import cached_property
 from pathlib import Path
 
 import mobase
@@ -11,12 +13,16 @@ from ...basic_features.basic_save_game_info import (
 
 
 class FF12SaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
+    def __init__(self, filepath: Path, f_stat: os.stat_result | None = None):
         super().__init__(filepath)
-        f_stat = self._filepath.stat()
-        self._size = f_stat.st_size
-        self._created = f_stat.st_birthtime
-        self._modified = f_stat.st_mtime
+        # Without stat information, the file is only stat'ed once size or times are requested.
+        if f_stat is not None:
+            self._stat = f_stat
+
+    @classmethod
+    def from_dir_entry(cls, entry: os.DirEntry) -> "FF12SaveGame":
+        """Create a save from a directory scan entry, reusing the stat information Windows returns with the scan."""
+        return cls(Path(entry.path), entry.stat())
 
     def getName(self) -> str:
         return f"Slot {self.getSlot()}"
@@ -24,23 +30,45 @@ class FF12SaveGame(BasicGameSaveGame):
     def getSaveGroupIdentifier(self) -> str:
         return "Default"
 
-    def getSlot(self) -> str:
+    @cached_property
+    def _stat(self) -> os.stat_result:
+        return self._filepath.stat()
+
+    @cached_property
+    def _slot(self) -> int:
         return int(self._filepath.stem[6:9])
 
+    @cached_property
+    def _birth_time(self) -> QDateTime:
+        f_stat = self._stat
+        return QDateTime.fromSecsSinceEpoch(int(getattr(f_stat, "st_birthtime", f_stat.st_ctime)))
+
+    @cached_property
+    def _creation_time(self) -> QDateTime:
+        return QDateTime.fromSecsSinceEpoch(int(self._stat.st_mtime))
+
+    def getSlot(self) -> str:
+        return self._slot
+
     def getSize(self) -> int:
-        return self._size
+        return self._stat.st_size
 
     def getBirthTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(int(self._created))
+        return self._birth_time
 
     def getCreationTime(self) -> QDateTime:
-        return QDateTime.fromSecsSinceEpoch(int(self._modified))
+        return self._creation_time
+
+    @cached_property
+    def _metadata(self) -> dict[str, str]:
+        """Metadata shown by MO2, formatted once as it's requested again whenever the save is hovered."""
+        return {
+            "Slot": self.getSlot(),
+            "Size": f"{self.getSize() / 1024:.2f} KB",
+            "Created At": format_date(self.getBirthTime()),
+            "Last Saved": format_date(self.getCreationTime())
+        }
 
 def getSaveMetadata(savepath: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
     assert isinstance(save, FF12SaveGame)
-    return {
-        "Slot": save.getSlot(),
-        "Size": f"{save.getSize() / 1024:.2f} KB",
-        "Created At": format_date(save.getBirthTime()),
-        "Last Saved": format_date(save.getCreationTime())
-    }
+    return dict(save._metadata)
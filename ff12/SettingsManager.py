@@ -9,6 +9,7 @@ class SettingName(StrEnum):
     DISABLE_AUTO_UPDATES = "disableAutoUpdates"
     SKIP_UPDATE_VERSION = "skipUpdateVersion"
     SKIP_UPDATE_UNTIL_DATE = "skipUpdateUntilDate"
+    GITHUB_TOKEN = "githubToken"
 
 class SettingsManager:
     _instance = None
@@ -16,6 +17,9 @@ class SettingsManager:
     def __init__(self, organizer: mobase.IOrganizer, game_name: str):
         self._organizer = organizer
         self._game_name = game_name
+        # Settings read so far, kept up to date on changes, so reads don't have to go through MO2 each time.
+        self._cache: dict[str, mobase.MoVariant] = {}
+        organizer.onPluginSettingChanged(self._on_plugin_setting_changed)
         SettingsManager._instance = self
 
     @staticmethod
@@ -25,10 +29,18 @@ class SettingsManager:
         return SettingsManager._instance
 
     def get_setting(self, key: str):
-        return self._organizer.pluginSetting(self._game_name, key)
+        if key not in self._cache:
+            self._cache[key] = self._organizer.pluginSetting(self._game_name, key)
+        return self._cache[key]
 
     def set_setting(self, key: str, value):
+        self._cache[key] = value
         self._organizer.setPluginSetting(self._game_name, key, value)
 
+    def _on_plugin_setting_changed(self, plugin_name: str, key: str, old: mobase.MoVariant, new: mobase.MoVariant):
+        # Changes made in MO2's settings dialog don't go through set_setting.
+        if plugin_name == self._game_name:
+            self._cache[key] = new
+
 def settings_manager():
     return SettingsManager.get_instance()
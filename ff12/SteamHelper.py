@@ -1,26 +1,72 @@
-import vdf
+import re
+from pathlib import Path
 
 from ...steam_utils import find_steam_path
 
+_steam_id_line = re.compile(r'\s*"(\d{17})"\s*$')
+_most_recent_line = re.compile(r'\s*"MostRecent"\s*"1"')
+
+# (path, modification time, Steam ID) of the last read loginusers.vdf.
+_last_logged_cache: tuple[Path, int, str | None] | None = None
+
 
 def get_last_logged_steam_id() -> str | None:
     """
     Retrieve the Steam ID of the most recently logged-in user from Steam's loginusers.vdf.
+    The file is only read again once it changed.
     """
+    global _last_logged_cache
+
     steam_path = find_steam_path()
     if steam_path is None:
         return None
 
     loginusers_path = steam_path / "config" / "loginusers.vdf"
     try:
+        mtime = loginusers_path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    if _last_logged_cache is not None and _last_logged_cache[:2] == (loginusers_path, mtime):
+        return _last_logged_cache[2]
+
+    steam_id = _read_last_logged_steam_id(loginusers_path)
+    _last_logged_cache = (loginusers_path, mtime, steam_id)
+    return steam_id
+
+def _read_last_logged_steam_id(loginusers_path: Path) -> str | None:
+    try:
+        first_steam_id = None
+        steam_id = None
+        # Users are listed as "<id>" lines followed by their "key" "value" lines,
+        # so there's no need to parse the whole file just to find the most recent one.
         with open(loginusers_path, "r", encoding = "utf-8") as f:
-            data = vdf.load(f)
+            for line in f:
+                match = _steam_id_line.match(line)
+                if match:
+                    steam_id = match.group(1)
+                    if first_steam_id is None:
+                        first_steam_id = steam_id
+                elif steam_id is not None and _most_recent_line.match(line):
+                    return steam_id
 
-        users = data.get("users", {})
-        for steam_id, info in users.items():
-            if info.get("MostRecent") == "1":
-                return steam_id
+        if first_steam_id is not None:
+            return first_steam_id
 
-        return next(iter(users), None)
+        # Not laid out as expected, let the full parser deal with it.
+        return _get_last_logged_steam_id_vdf(loginusers_path)
     except Exception:
         return None
+
+def _get_last_logged_steam_id_vdf(loginusers_path: Path) -> str | None:
+    import vdf
+
+    with open(loginusers_path, "r", encoding = "utf-8") as f:
+        data = vdf.load(f)
+
+    users = data.get("users", {})
+    for steam_id, info in users.items():
+        if info.get("MostRecent") == "1":
+            return steam_id
+
+    return next(iter(users), None)
@@ -1,10 +1,10 @@
 import os
+import re
 import shutil
 from pathlib import Path
 
 import mobase
 from PyQt6.QtCore import (
-    QDateTime,
     QDir,
     QFileInfo,
     QStandardPaths,
@@ -27,6 +27,12 @@ VERSION_MINOR = 0
 VERSION_PATCH = 0
 VERSION_RELEASE_TYPE = mobase.ReleaseType.BETA
 
+# Save files are named FFXII_000 to FFXII_999.
+_save_name_match = re.compile(r"FFXII_\d{3}", re.ASCII | re.IGNORECASE).fullmatch
+
+# Plain string key for documentsDirectory, which MO2 calls a lot, to skip the enum member lookup.
+_STEAM_ID_64_KEY: str = SettingName.STEAM_ID_64.value
+
 class FF12TZAGame(BasicGame):
     Name = "Final Fantasy XII TZA Support Plugin"
     Author = "ffgriever & Xeavin"
@@ -39,14 +45,22 @@ class FF12TZAGame(BasicGame):
     GameSavesDirectory = "%GAME_DOCUMENTS%"
 
     _archives_tab: ArchiveContainerWidget
+    _update_checker: UpdateChecker
 
     def __init__(self):
         super().__init__()
         self._suppress_setting_callback = False
+        self._plugin_name = ""
+        # Steam ID the documents directory was last built for, along with the directory.
+        self._documents_directory: tuple[str, QDir] | None = None
+        self._cmd_path: str | None = None
+        # Game directory the launcher command was last built for, along with the command.
+        self._launcher_cmd: tuple[str, str] | None = None
 
     def init(self, organizer: mobase.IOrganizer) -> bool:
         super().init(organizer)
-        SettingsManager(organizer, self.name())
+        self._plugin_name = self.name()
+        SettingsManager(organizer, self._plugin_name)
         self._register_feature(FF12ModDataChecker())
         self._register_feature(BasicLocalSavegames(self.savesDirectory()))
         self._register_feature(BasicGameSaveGameInfo(get_metadata = getSaveMetadata))
@@ -105,48 +119,67 @@ class FF12TZAGame(BasicGame):
                 ),
                 default_value = 0,
             ),
+            mobase.PluginSetting(
+                SettingName.GITHUB_TOKEN,
+                (
+                    "Optional GitHub access token used for update checks, raising the GitHub API rate limit."
+                ),
+                default_value = "",
+            ),
         ]
 
     def documentsDirectory(self) -> QDir:
+        steam_id = settings_manager().get_setting(_STEAM_ID_64_KEY)
+        if self._documents_directory is not None and self._documents_directory[0] == steam_id:
+            return QDir(self._documents_directory[1])
+
         docs_path = QDir(
             QDir(
                 QStandardPaths.writableLocation(QStandardPaths.StandardLocation.DocumentsLocation)
             ).filePath("My Games/FINAL FANTASY XII THE ZODIAC AGE")
         )
 
-        steam_id = settings_manager().get_setting(SettingName.STEAM_ID_64)
         if steam_id:
             docs_path = QDir(docs_path.absoluteFilePath(steam_id))
 
-        return docs_path
+        self._documents_directory = (steam_id, docs_path)
+        return QDir(docs_path)
 
     def executables(self):
             # Windows isn't necessarily installed in "C:\Windows\".
-            cmd_path = shutil.which('cmd.exe')
-
-            # We're using cmd.exe to launch a launcher, because otherwise it can't be accessed
-            # using VFS. Otherwise we would have to scan mods and detect where it actually is.
-            default_launcher_path = self.gameDirectory().absoluteFilePath("x64/ff12-launcher.exe")
-
-            # If launcher exists, run it, else set color to red and show message.
-            launcher_cmd = (
-                f'if exist "{default_launcher_path}" '
-                f'("{default_launcher_path}") '
-                f'else (color 0C && echo Launcher not found: "{default_launcher_path}". && echo Please install External File Loader with MO2 support. && pause && color)'
-            )
+            # Searching PATH for it on every call adds up, as MO2 asks for executables often.
+            if self._cmd_path is None:
+                self._cmd_path = shutil.which('cmd.exe')
+            cmd_path = self._cmd_path
+
+            game_dir = self.gameDirectory()
+            game_path = game_dir.absolutePath()
+            if self._launcher_cmd is None or self._launcher_cmd[0] != game_path:
+                # We're using cmd.exe to launch a launcher, because otherwise it can't be accessed
+                # using VFS. Otherwise we would have to scan mods and detect where it actually is.
+                default_launcher_path = game_dir.absoluteFilePath("x64/ff12-launcher.exe")
+
+                # If launcher exists, run it, else set color to red and show message.
+                launcher_cmd = (
+                    f'if exist "{default_launcher_path}" '
+                    f'("{default_launcher_path}") '
+                    f'else (color 0C && echo Launcher not found: "{default_launcher_path}". && echo Please install External File Loader with MO2 support. && pause && color)'
+                )
+                self._launcher_cmd = (game_path, launcher_cmd)
+            launcher_cmd = self._launcher_cmd[1]
 
             return [
                 mobase.ExecutableInfo(
                     f"{self.gameName()} (Modded)",
                     QFileInfo(cmd_path)
-                ).withArgument(f'/c {launcher_cmd}').withWorkingDirectory(self.gameDirectory().absoluteFilePath("x64")),
+                ).withArgument(f'/c {launcher_cmd}').withWorkingDirectory(game_dir.absoluteFilePath("x64")),
                 mobase.ExecutableInfo(
                     f"{self.gameName()} (Vanilla)",
-                    QFileInfo(self.gameDirectory().absoluteFilePath(self.binaryName())),
+                    QFileInfo(game_dir.absoluteFilePath(self.binaryName())),
                 ),
                 mobase.ExecutableInfo(
                     "Configuration Tool",
-                    QFileInfo(self.gameDirectory().absoluteFilePath("x64/FFXII_TZA_GameSetting.exe")),
+                    QFileInfo(game_dir.absoluteFilePath("x64/FFXII_TZA_GameSetting.exe")),
                 ),
                 mobase.ExecutableInfo(
                     "Reload VFS",
@@ -161,11 +194,23 @@ class FF12TZAGame(BasicGame):
         ]
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        return [
-            FF12SaveGame(path)
-            for path in Path(folder.absolutePath()).glob("FFXII_???")
-            if path.is_file() and path.name[6:9].isdigit()
-        ]
+        try:
+            entries = os.scandir(folder.absolutePath())
+        except OSError:
+            return []
+
+        saves = []
+        with entries:
+            for entry in entries:
+                if not _save_name_match(entry.name):
+                    continue
+                # A save that is locked or deleted during the scan is skipped instead of hiding all others.
+                try:
+                    if entry.is_file():
+                        saves.append(FF12SaveGame.from_dir_entry(entry))
+                except OSError:
+                    continue
+        return saves
 
     def _on_plugin_setting_changed_callback(
         self,
@@ -174,7 +219,7 @@ class FF12TZAGame(BasicGame):
         old: mobase.MoVariant,
         new: mobase.MoVariant,
     ):
-        if plugin_name != self.name() or self._suppress_setting_callback is True:
+        if plugin_name != self._plugin_name or self._suppress_setting_callback is True:
             return
 
         if setting == SettingName.AUTO_STEAM_ID and old is False and new is True:
@@ -226,12 +271,6 @@ class FF12TZAGame(BasicGame):
         if settings_manager().get_setting(SettingName.DISABLE_AUTO_UPDATES) is True:
             return
 
-        remind_time = settings_manager().get_setting(SettingName.SKIP_UPDATE_UNTIL_DATE)
-        now_secs = int(QDateTime.currentDateTime().toSecsSinceEpoch())
-
-        if remind_time and now_secs is not None and remind_time > now_secs:
-            return
-
         update_checker = UpdateChecker(
             "FF12 Plugin",
             "FF12-Modding", "FF12-MO2-Plugin",
@@ -241,7 +280,10 @@ class FF12TZAGame(BasicGame):
             update_targets=["game_ff12.py", "ff12"],
             remove_targets=["ff12"],
             skip_version=settings_manager().get_setting(SettingName.SKIP_UPDATE_VERSION),
+            skip_until=settings_manager().get_setting(SettingName.SKIP_UPDATE_UNTIL_DATE),
             plugin_dir=os.path.dirname(__file__),
+            cache_path=os.path.join(self._organizer.pluginDataPath(), "ff12", "update_cache.json"),
+            github_token=settings_manager().get_setting(SettingName.GITHUB_TOKEN),
         )
 
         # We're using non-modal dialogs, so we have to use callbacks to clear settings.
@@ -259,3 +301,6 @@ class FF12TZAGame(BasicGame):
         update_checker.on_version_skipped(on_version_skipped)
         update_checker.on_update_remind(on_update_remind)
         update_checker.check_for_update()
+
+        # Checking runs in background, so keep the checker alive until it's done.
+        self._update_checker = update_checker